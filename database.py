@@ -9,6 +9,9 @@ Under normal circumstances, the main module creates one NEODatabase from the
 data on NEOs and close approaches extracted by `extract.load_neos` and
 `extract.load_approaches`.
 """
+import math
+
+import numpy as np
 
 
 class NEODatabase:
@@ -43,6 +46,27 @@ class NEODatabase:
         self._name_to_neo = {i.name: i for i in self._neos}
         self._approaches = [i.set_neo(self._pdes_to_neo) for i in approaches]
 
+        # Columns of the filterable attributes of the approaches, keyed like
+        # the `bounds` of `filters.Filters`, for vectorized queries. They are
+        # filled straight from generators to avoid intermediate lists.
+        approaches, count = self._approaches, len(self._approaches)
+        self._columns = {
+            'date_ordinal': np.fromiter((i.date_ordinal for i in approaches),
+                                        dtype=np.int64, count=count),
+            'distance': np.fromiter((i.distance for i in approaches),
+                                    dtype=np.float64, count=count),
+            'velocity': np.fromiter((i.velocity for i in approaches),
+                                    dtype=np.float64, count=count),
+            'neo.diameter': np.fromiter(
+                (math.nan if i.neo is None else i.neo.diameter
+                 for i in approaches), dtype=np.float64, count=count),
+            'neo.hazardous': np.fromiter(
+                (i.neo is not None and i.neo.hazardous for i in approaches),
+                dtype=bool, count=count),
+        }
+        self._linked = np.fromiter((i.neo is not None for i in approaches),
+                                   dtype=bool, count=count)
+
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
 
@@ -82,12 +106,46 @@ class NEODatabase:
         The `CloseApproach` objects are generated in internal order which isn't
         guaranteed to be sorted meaningfully, although is often sorted by time.
 
+        Filters created by `create_filters` are evaluated on whole columns of
+        attribute values at once; any other collection of filters, or one
+        bounding attributes that have no column, is applied by calling each
+        filter on each approach.
+
         :param filters: A collection of filters for user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
+        bounds = getattr(filters, 'bounds', None)
+        if bounds is not None and bounds.keys() <= self._columns.keys():
+            # Look up matches one index at a time, so that a consumer that
+            # stops early (such as `limit`) only touches the ones it takes.
+            yield from map(self._approaches.__getitem__, self._match(bounds))
+            return
+
         approaches = self._approaches
         if filters:
             for f in filters:
                 approaches = filter(f, approaches)
         for approach in approaches:
             yield approach
+
+    def _match(self, bounds):
+        """Find the approaches whose attributes lie within the given bounds.
+
+        The bounds are checked in order, each one only on the approaches that
+        satisfied all of the previous ones. Like the predicates of
+        `filters.Filters`, an approach without a linked NEO doesn't match any
+        bounds on the attributes of its NEO.
+
+        :param bounds: A dict mapping column names to `(low, high)` bounds.
+        :return: An array of the indices of the matching approaches.
+        """
+        indices = np.arange(len(self._approaches))
+        if any(name.startswith('neo.') for name in bounds):
+            # Approaches without a linked NEO don't match criteria on it.
+            indices = indices[self._linked]
+        for name, (low, high) in bounds.items():
+            column = self._columns[name][indices]
+            low = np.array(low, dtype=column.dtype)
+            high = np.array(high, dtype=column.dtype)
+            indices = indices[(low <= column) & (column <= high)]
+        return indices
@@ -7,37 +7,186 @@ The `load_approaches` function extracts close approach data from a JSON file,
 formatted as described in the project instructions, into a collection of
 `CloseApproach` objects.
 
+Both functions cache the extracted collection in a pickle file, and reuse it
+instead of parsing the data file again for as long as neither the data file
+nor the code that extracts it has changed. Pass `cache=False` to always parse
+the data file.
+
+The cache files live in a per-user directory, `CACHE_DIR` (by default
+`$XDG_CACHE_HOME/neo-close-approaches`, or `~/.cache/neo-close-approaches`),
+which is created private to the user, and only cache files owned by the user
+are read. Loading a pickle can run arbitrary code, so that directory must not
+be writable by anyone else - don't point `XDG_CACHE_HOME` at a shared location.
+
 The main module calls these functions with the arguments provided at the
 command line, and uses the resulting collections to build an `NEODatabase`.
 """
-import json
-import pandas as pd
+import contextlib
+import csv
+import functools
+import gc
+import hashlib
+import os
+import pickle
+
+import orjson
 
 from models import NearEarthObject, CloseApproach
 
+# Directory holding the caches of extracted data.
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'neo-close-approaches')
+
+# Modules whose code determines the extracted objects; changing any of them
+# invalidates all caches.
+_CODE_FILES = ('extract.py', 'models.py', 'helpers.py')
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Pause the cyclic garbage collector for the duration of a block.
+
+    Extracting data allocates hundreds of thousands of objects, none of them
+    garbage, which would otherwise trigger many futile (and increasingly slow)
+    collections.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@functools.lru_cache(maxsize=None)
+def _code_fingerprint():
+    """Hash the source of the modules that build the extracted objects."""
+    digest = hashlib.sha256()
+    root = os.path.dirname(os.path.abspath(__file__))
+    for name in _CODE_FILES:
+        with open(os.path.join(root, name), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def _cache_key(path):
+    """Describe the exact version of a data file and of the extraction code."""
+    stat = os.stat(path)
+    return _code_fingerprint(), stat.st_mtime_ns, stat.st_size
+
+
+def _cache_path(path):
+    """Return the path of the cache file for a data file."""
+    real_path = os.path.realpath(path)
+    digest = hashlib.sha256(os.fsencode(real_path)).hexdigest()[:16]
+    return os.path.join(CACHE_DIR,
+                        f'{os.path.basename(real_path)}-{digest}.pickle')
+
 
-def load_neos(neo_csv_path: str):
+def _read_cache(cache_path, key):
+    """Return the data cached under `key`, or None if there is none.
+
+    A missing, foreign, unreadable or corrupt cache file, one written for
+    another key or one referring to code that no longer exists just means
+    that there is nothing to reuse.
+    """
+    try:
+        with open(cache_path, "rb") as file:
+            if hasattr(os, 'getuid') and \
+                    os.fstat(file.fileno()).st_uid != os.getuid():
+                return None
+            cached = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError, IndexError, TypeError, ValueError):
+        return None
+    if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == key:
+        return cached[1]
+    return None
+
+
+def _write_cache(cache_path, key, data):
+    """Save data under `key` in a cache file, if possible."""
+    # Write to a temporary file first, so that an interrupted run can't leave
+    # a truncated cache behind.
+    temp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        with open(temp_path, "wb") as file:
+            pickle.dump((key, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        # Caching is only an optimization, e.g. for a read-only home.
+        pass
+    finally:
+        # Don't leave the temporary file behind, even on a KeyboardInterrupt.
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
+def _load(read, path, cache):
+    """Extract a collection from a data file with `read`, through its cache.
+
+    :param read: A function extracting a collection from a data file path.
+    :param path: A path to the data file.
+    :param cache: Whether to use (and update) the cache file of `path`.
+    :return: The extracted collection.
+    """
+    with _gc_paused():
+        if not cache:
+            return read(path)
+        cache_path = _cache_path(path)
+        key = _cache_key(path)
+        data = _read_cache(cache_path, key)
+        if data is None:
+            data = read(path)
+            _write_cache(cache_path, key, data)
+        return data
+
+
+def load_neos(neo_csv_path: str, cache=True):
     """Read near-Earth object information from a CSV file.
 
     :param neo_csv_path: A path to a CSV file containing near-Earth objects.
+    :param cache: Whether to reuse (and update) a cache of the extracted NEOs.
     :return: A collection of `NearEarthObject`s.
     """
-    usecols = ['pdes', 'name', 'diameter', 'pha']
-    df = pd.read_csv(neo_csv_path, low_memory=False, usecols=usecols)
-    neos = [NearEarthObject(**row) for row in df.to_dict(orient='records')]
+    return _load(_read_neos, neo_csv_path, cache)
+
+
+def _read_neos(neo_csv_path):
+    """Parse near-Earth objects from a CSV file, without caching."""
+    with open(neo_csv_path, "r", newline='') as file:
+        reader = csv.reader(file)
+        # Only pick out the four columns used, rather than building a dict of
+        # all (dozens of) columns for every row.
+        i_pdes, i_name, i_diameter, i_pha = map(next(reader).index,
+                                                ("pdes", "name", "diameter",
+                                                 "pha"))
+        neos = [NearEarthObject(row[i_pdes], row[i_name], row[i_diameter],
+                                row[i_pha])
+                for row in reader]
     return neos
 
 
-def load_approaches(cad_json_path):
+def load_approaches(cad_json_path, cache=True):
     """Read close approach data from a JSON file.
 
     :param cad_json_path: A path to a JSON file containing close approaches.
+    :param cache: Whether to reuse (and update) a cache of the approaches.
     :return: A collection of `CloseApproach`es.
     """
-    with open(cad_json_path, "r") as file:
-        json_data = json.load(file)
-        dict_data = [dict(zip(json_data["fields"], data))
-                     for data in json_data["data"]]
-        approaches = [CloseApproach(d["des"], d["cd"], d["dist"], d["v_rel"])
-                      for d in dict_data]
+    return _load(_read_approaches, cad_json_path, cache)
+
+
+def _read_approaches(cad_json_path):
+    """Parse close approaches from a JSON file, without caching."""
+    with open(cad_json_path, "rb") as file:
+        json_data = orjson.loads(file.read())
+    i_des, i_cd, i_dist, i_vrel = map(json_data["fields"].index,
+                                      ("des", "cd", "dist", "v_rel"))
+    approaches = [CloseApproach(row[i_des], row[i_cd], row[i_dist],
+                                row[i_vrel])
+                  for row in json_data["data"]]
     return approaches
@@ -5,143 +5,128 @@ the `query` method to generate a stream of `CloseApproach` objects that match
 all of the desired criteria. The arguments to `create_filters` are provided by
 the main module and originate from the user's command-line options.
 
-This function can be thought to return a collection of instances of subclasses
-of `AttributeFilter` - a 1-argument callable (on a `CloseApproach`) constructed
-from a comparator (from the `operator` module), a reference value, and a class
-method `get` that subclasses can override to fetch an attribute of interest
-from the supplied `CloseApproach`.
+This function returns a collection holding a single 1-argument predicate (on a
+`CloseApproach`), generated for the given criteria: its source hard-codes one
+comparison per bounded attribute, joined by `and` so that evaluation stops at
+the first failed criterion, and the reference values are bound in a closure.
+Calling it involves no further function calls, method dispatch or loops over
+filters. The returned `Filters` collection also records the bounds for the
+vectorized evaluation in `NEODatabase.query`.
 
 The `limit` function simply limits the maximum number of values produced by an
 iterator.
 """
+import datetime
 import itertools
-from operator import eq, ge, le
+import keyword
+import math
+import types
 
 
-class UnsupportedCriterionError(NotImplementedError):
-    """A filter criterion is unsupported."""
+def compile_predicate(bounds):
+    """Generate a predicate checking all of the given bounds at once.
 
+    For example, `{'distance': (0.1, math.inf), 'neo.hazardous': (True, True)}`
+    results in the equivalent of::
 
-class AttributeFilter:
-    """A general superclass for filters on comparable attributes.
+        def matches(approach):
+            return (low0 <= approach.distance <= high0
+                    and approach.neo is not None
+                    and approach.neo.hazardous == value1)
 
-    An `AttributeFilter` represents the search criteria pattern comparing some
-    attribute of a close approach (or its attached NEO) to a reference value.
-    It functions as a callable predicate for whether a `CloseApproach`
-    object satisfies the encoded criterion.
+    with `low0`, `high0` and `value1` bound to the reference values.
 
-    It is constructed with a comparator operator and a reference value, and
-    calling the filter (with __call__) executes `get(approach) OP value` (in
-    infix notation).
+    A nested attribute only matches if every object on the way to it is
+    present, so an approach without a NEO fails all criteria on the NEO.
 
-    Concrete subclasses can override the `get` classmethod to provide custom
-    behavior to fetch a desired attribute from the given `CloseApproach`.
+    :param bounds: A dict mapping attribute names of a `CloseApproach`, dotted
+        for nested attributes, to inclusive `(low, high)` bounds.
+    :return: A predicate on `CloseApproach` objects.
     """
-
-    def __init__(self, op, value):
-        """Construct a new `AttributeFilter` from an predicate and a value.
-
-        The reference value will be supplied as the second (right-hand side)
-        argument to the operator function. For example, an `AttributeFilter`
-        with `op=operator.le` and `value=10` will, when called on an approach,
-        evaluate `some_attribute <= 10`.
-
-        If value is None, the filter isn't applied and returns True.
-
-        :param op: A 2-argument predicate comparator (such as `operator.le`).
-        :param value: The reference value to compare against.
-        """
-        self.op = op
-        self.value = value
-
-    def __call__(self, approach):
-        """Invoke `self(approach)`."""
-        if self.value is None:
-            return True
+    names, values, clauses, guarded = [], [], [], set()
+    for i, (attribute, (low, high)) in enumerate(bounds.items()):
+        parts = attribute.split('.')
+        if not all(part.isidentifier() and not keyword.iskeyword(part)
+                   for part in parts):
+            raise ValueError(f"Invalid attribute name: {attribute!r}")
+        # An approach without a linked NEO (`approach.neo is None`) doesn't
+        # match any criterion on the attributes of its NEO.
+        for end in range(1, len(parts)):
+            prefix = '.'.join(parts[:end])
+            if prefix not in guarded:
+                guarded.add(prefix)
+                clauses.append(f'approach.{prefix} is not None')
+        if low == high:
+            names.append(f'value{i}')
+            values.append(low)
+            clauses.append(f'approach.{attribute} == value{i}')
         else:
-            return self.op(self.get(approach), self.value)
-
-    @classmethod
-    def get(cls, approach):
-        """Get an attribute of interest from a close approach.
-
-        Concrete subclasses must override this method to get an attribute of
-        interest from the supplied `CloseApproach`.
-
-        :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The attribute value, comparable to `self.value` via `self.op`.
-        """
-        raise UnsupportedCriterionError
-
-    def __repr__(self):
-        """Return a computer-readable string representation of this filter."""
-        return f"{self.__class__.__name__}" \
-               f"(op=operator.{self.op.__name__}, value={self.value})"
-
-
-class DateFilter(AttributeFilter):
-    """Subclass of `AttributeFilter` to filter `CloseApproach` by date."""
-
-    @classmethod
-    def get(cls, approach):
-        """Get approach.time.date() for the date filter.
-
-        :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The date of the `CloseApproach`.
-        """
-        return approach.time.date()
-
-
-class DistanceFilter(AttributeFilter):
-    """Subclass of `AttributeFilter` to filter `CloseApproach` by distance."""
-
-    @classmethod
-    def get(cls, approach):
-        """Get approach.distance for the distance filter.
-
-        :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The distance of the `CloseApproach`.
-        """
-        return approach.distance
-
-
-class VelocityFilter(AttributeFilter):
-    """Subclass of `AttributeFilter` to filter `CloseApproach` by velocity."""
+            names.extend((f'low{i}', f'high{i}'))
+            values.extend((low, high))
+            clauses.append(f'low{i} <= approach.{attribute} <= high{i}')
+
+    source = (f"def bind({', '.join(names)}):\n"
+              f"    def matches(approach):\n"
+              f"        return {' and '.join(clauses) or 'True'}\n"
+              f"    return matches\n")
+    namespace = {}
+    exec(source, namespace)
+    return namespace['bind'](*values)
+
+
+class Filters(tuple):
+    """A collection of filters that also records the bounds they check.
+
+    A `Filters` object is an immutable tuple of predicates, usable wherever
+    any collection of filters is. In addition, its read-only `bounds` map the
+    (dotted) name of each filtered `CloseApproach` attribute to the inclusive
+    `(low, high)` bounds on it, which lets `NEODatabase.query` evaluate all of
+    the filters at once on columns of attribute values instead of calling the
+    predicates. Being immutable, the predicates can't drift from the bounds;
+    combining them with other filters (e.g. with `+`) yields a plain tuple.
+    """
 
-    @classmethod
-    def get(cls, approach):
-        """Get approach.velocity for the velocity filter.
+    def __new__(cls, bounds):
+        """Create the filter checking the given attribute bounds.
 
-        :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The distance of the `CloseApproach`.
+        :param bounds: A dict mapping attribute names of a `CloseApproach`,
+            dotted for nested attributes, to `(low, high)` bounds.
         """
-        return approach.velocity
+        filters = super().__new__(
+            cls, (compile_predicate(bounds),) if bounds else ())
+        # Tuple subclasses can't have slots, so bypass `__setattr__` once.
+        object.__setattr__(filters, '_bounds',
+                           types.MappingProxyType(dict(bounds)))
+        return filters
 
+    @property
+    def bounds(self):
+        """Return the read-only bounds checked by these filters."""
+        return self._bounds
 
-class DiameterFilter(AttributeFilter):
-    """Subclass of `AttributeFilter` to filter `CloseApproach` by diameter."""
+    def __setattr__(self, name, value):
+        """Refuse to set attributes, which would let the bounds drift."""
+        raise AttributeError(f"{self.__class__.__name__!r} object is "
+                             f"immutable")
 
-    @classmethod
-    def get(cls, approach):
-        """Get approach.neo.diameter for the diameter filter.
-
-        :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The NEO's diameter of the `CloseApproach`.
-        """
-        return approach.neo.diameter
+    def __delattr__(self, name):
+        """Refuse to delete attributes, which would let the bounds drift."""
+        raise AttributeError(f"{self.__class__.__name__!r} object is "
+                             f"immutable")
 
+    def __getnewargs__(self):
+        """Return the arguments to recreate these filters when copied."""
+        return (dict(self.bounds),)
 
-class HazardousFilter(AttributeFilter):
-    """Subclass of `AttributeFilter` to filter `CloseApproach` by risk."""
+    def __getstate__(self):
+        """Return no further state; `__new__` rebuilds everything."""
+        return None
 
-    @classmethod
-    def get(cls, approach):
-        """Get approach.neo.hazardous for the diameter filter.
 
-        :param approach: A `CloseApproach` on which to evaluate this filter.
-        :return: The NEO's potential hazardousness of the `CloseApproach`.
-        """
-        return approach.neo.hazardous
+def _bounds(low, high, lowest=-math.inf, highest=math.inf):
+    """Replace missing bounds of a range by unreachable values."""
+    return (lowest if low is None else low,
+            highest if high is None else high)
 
 
 def create_filters(
@@ -167,8 +152,9 @@ def create_filters(
 
     The return value must be compatible with the `query` method of
     `NEODatabase` because the main module directly passes this result
-    to that method. For now, this can be thought of as a collection of
-    `AttributeFilter`s.
+    to that method. It is a `Filters` collection holding one predicate that
+    checks every specified option. Unspecified options aren't checked at all,
+    and the others are checked in order of selectivity, most selective first.
 
     :param date: A `date` on which a `CloseApproach` occurs.
     :param start_date: A `date` on or after which a `CloseApproach` occurs.
@@ -182,18 +168,28 @@ def create_filters(
     :param hazardous: Whether the NEO of a `CloseApproach` is hazardous.
     :return: A collection of filters for use with `query`.
     """
-    filters = []
-    filters.append(DateFilter(eq, date))
-    filters.append(DateFilter(ge, start_date))
-    filters.append(DateFilter(le, end_date))
-    filters.append(DistanceFilter(ge, distance_min))
-    filters.append(DistanceFilter(le, distance_max))
-    filters.append(VelocityFilter(ge, velocity_min))
-    filters.append(VelocityFilter(le, velocity_max))
-    filters.append(DiameterFilter(ge, diameter_min))
-    filters.append(DiameterFilter(le, diameter_max))
-    filters.append(HazardousFilter(eq, hazardous))
-    return filters
+    if date is not None:
+        # An exact date narrows the date range down to a single day.
+        start_date = date if start_date is None else max(start_date, date)
+        end_date = date if end_date is None else min(end_date, date)
+
+    # The bounds are checked in order, so the most selective ones come first
+    # to spare the others from being evaluated on most approaches.
+    bounds = {}
+    if hazardous is not None:
+        bounds['neo.hazardous'] = (hazardous, hazardous)
+    if start_date is not None or end_date is not None:
+        # Dates are compared as ordinals, like `CloseApproach.date_ordinal`.
+        low, high = _bounds(start_date, end_date,
+                            datetime.date.min, datetime.date.max)
+        bounds['date_ordinal'] = (low.toordinal(), high.toordinal())
+    if diameter_min is not None or diameter_max is not None:
+        bounds['neo.diameter'] = _bounds(diameter_min, diameter_max)
+    if distance_min is not None or distance_max is not None:
+        bounds['distance'] = _bounds(distance_min, distance_max)
+    if velocity_min is not None or velocity_max is not None:
+        bounds['velocity'] = _bounds(velocity_min, velocity_max)
+    return Filters(bounds)
 
 
 def limit(iterator, n=None):
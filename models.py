@@ -27,17 +27,20 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    # Fixed attribute slots keep the many instances small and fast to access.
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
     def __init__(self, pdes: str, name: str, diameter: float, pha: str):
         """Create a new `NearEarthObject`.
 
         :param pdes: The NEO’s primary designation
-        :param name: The NEO’s IAU name (possibly missing)
-        :param diameter: The NEO’s diameter in kilometers, or NaN
+        :param name: The NEO’s IAU name (possibly empty)
+        :param diameter: The NEO’s diameter in kilometers (possibly empty)
         :param pha: Flag whether the NEO is potentially hazardous
         """
         self.designation = str(pdes)
-        self.name = str(name) if str(name) != 'nan' else None
-        self.diameter = float(diameter) or float('nan')
+        self.name = str(name) if name else None
+        self.diameter = float(diameter) if diameter else float('nan')
         self.hazardous = True if pha == 'Y' else False
 
         # Create an empty initial collection of linked approaches.
@@ -94,6 +97,10 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    # Fixed attribute slots keep the many instances small and fast to access.
+    __slots__ = ('_designation', 'time', 'date_ordinal', 'distance',
+                 'velocity', 'neo')
+
     def __init__(self, pdes: str, time: str, distance: float, velocity: float):
         """Create a new `CloseApproach`.
 
@@ -104,6 +111,9 @@ class CloseApproach:
         """
         self._designation = str(pdes)
         self.time = cd_to_datetime(time)
+        # Cache the calendar date as a proleptic Gregorian ordinal (days), so
+        # that date filters compare plain integers.
+        self.date_ordinal = self.time.toordinal()
         self.distance = float(distance)
         self.velocity = float(velocity)
 
@@ -26,8 +26,8 @@ TEST_CAD_FILE = TESTS_ROOT / 'test-cad-2020.json'
 class TestDatabase(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.neos = load_neos(TEST_NEO_FILE)
-        cls.approaches = load_approaches(TEST_CAD_FILE)
+        cls.neos = load_neos(TEST_NEO_FILE, cache=False)
+        cls.approaches = load_approaches(TEST_CAD_FILE, cache=False)
         cls.db = NEODatabase(cls.neos, cls.approaches)
 
     def test_database_construction_links_approaches_to_neos(self):
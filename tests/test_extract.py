@@ -10,10 +10,16 @@ To run these tests from the project root, run:
 """
 import collections.abc
 import datetime
+import os
 import pathlib
 import math
+import pickle
+import shutil
+import tempfile
 import unittest
+import unittest.mock
 
+import extract
 from extract import load_neos, load_approaches
 from models import NearEarthObject, CloseApproach
 
@@ -26,7 +32,7 @@ TEST_CAD_FILE = TESTS_ROOT / 'test-cad-2020.json'
 class TestLoadNEOs(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.neos = load_neos(TEST_NEO_FILE)
+        cls.neos = load_neos(TEST_NEO_FILE, cache=False)
         cls.neos_by_designation = {neo.designation: neo for neo in cls.neos}
 
     @classmethod
@@ -79,7 +85,7 @@ class TestLoadNEOs(unittest.TestCase):
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.approaches = load_approaches(TEST_CAD_FILE)
+        cls.approaches = load_approaches(TEST_CAD_FILE, cache=False)
 
     @classmethod
     def get_first_approach_or_none(cls):
@@ -116,5 +122,80 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TestLoadCache(unittest.TestCase):
+    def setUp(self):
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.neo_file = pathlib.Path(tempdir.name) / TEST_NEO_FILE.name
+        shutil.copy(TEST_NEO_FILE, self.neo_file)
+        self.cache_dir = pathlib.Path(tempdir.name) / 'cache'
+        patcher = unittest.mock.patch('extract.CACHE_DIR', str(self.cache_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache_file = pathlib.Path(extract._cache_path(self.neo_file))
+
+    def replace_neo_file(self, mtime_offset):
+        # Replace the data file, e.g. by `cp -p`, with a shifted modification time.
+        os.utime(self.neo_file)
+        mtime = os.path.getmtime(self.neo_file) + mtime_offset
+        with open(self.neo_file, 'w') as file:
+            file.write('pdes,name,diameter,pha\n433,Eros,16.84,N\n')
+        os.utime(self.neo_file, (mtime, mtime))
+
+    def test_load_writes_cache(self):
+        neos = load_neos(self.neo_file)
+        self.assertTrue(self.cache_file.exists())
+        cached = load_neos(neo_csv_path=self.neo_file)
+        self.assertEqual([neo.designation for neo in neos],
+                         [neo.designation for neo in cached])
+
+    def test_load_without_cache_writes_no_cache(self):
+        load_neos(self.neo_file, cache=False)
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_cache_is_kept_out_of_the_data_directory(self):
+        load_neos(self.neo_file)
+        self.assertEqual(self.cache_file.parent, self.cache_dir)
+        self.assertEqual(sorted(os.listdir(self.neo_file.parent)),
+                         sorted([self.neo_file.name, self.cache_dir.name]))
+
+    def test_cache_of_newer_data_file_is_ignored(self):
+        load_neos(self.neo_file)
+        self.replace_neo_file(+10)
+        neos = load_neos(self.neo_file)
+        self.assertEqual([neo.designation for neo in neos], ['433'])
+
+    def test_cache_of_older_data_file_is_ignored(self):
+        load_neos(self.neo_file)
+        self.replace_neo_file(-10)
+        neos = load_neos(self.neo_file)
+        self.assertEqual([neo.designation for neo in neos], ['433'])
+
+    def test_cache_of_other_code_is_ignored(self):
+        load_neos(self.neo_file)
+        with unittest.mock.patch('extract._code_fingerprint', return_value=''):
+            neos = load_neos(self.neo_file)
+        self.assertEqual(len(neos), 4226)
+        with open(self.cache_file, 'rb') as file:
+            self.assertEqual(pickle.load(file)[0][0], '')
+
+    def test_invalid_cache_is_rebuilt(self):
+        self.cache_dir.mkdir()
+        for content in (b'', b'garbage', pickle.dumps(5), pickle.dumps((1, 2, 3)),
+                        b'cnonexistent_module\nthing\n.'):
+            with self.subTest(content=content):
+                self.cache_file.write_bytes(content)
+                self.assertEqual(len(load_neos(self.neo_file)), 4226)
+
+    def test_failed_cache_write_leaves_no_files(self):
+        for error in (pickle.PicklingError, KeyboardInterrupt):
+            with self.subTest(error=error):
+                with unittest.mock.patch('pickle.dump', side_effect=error):
+                    try:
+                        self.assertEqual(len(load_neos(self.neo_file)), 4226)
+                    except KeyboardInterrupt:
+                        pass
+                self.assertEqual(os.listdir(self.cache_dir), [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,13 +10,17 @@ To run these tests from the project root, run::
 
     $ python3 -m unittest --verbose tests.test_query
 """
+import copy
 import datetime
 import pathlib
+import pickle
+import types
 import unittest
 
 from database import NEODatabase
 from extract import load_neos, load_approaches
-from filters import create_filters
+from filters import compile_predicate, create_filters, Filters
+from models import CloseApproach
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -30,8 +34,8 @@ class TestQuery(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.neos = load_neos(TEST_NEO_FILE)
-        cls.approaches = load_approaches(TEST_CAD_FILE)
+        cls.neos = load_neos(TEST_NEO_FILE, cache=False)
+        cls.approaches = load_approaches(TEST_CAD_FILE, cache=False)
         cls.db = NEODatabase(cls.neos, cls.approaches)
 
     def test_query_all(self):
@@ -527,5 +531,99 @@ class TestQuery(unittest.TestCase):
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
 
+class TestQueryPlainFilters(TestQuery):
+    """Repeat the queries, passing the filters as a plain list of predicates.
+
+    Without the `bounds` of a `Filters` collection, `query` calls the filters
+    on each approach instead of evaluating them on columns.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        query = cls.db.query
+        cls.db = types.SimpleNamespace(query=lambda filters=(): query(list(filters)))
+
+
+class TestQueryUnlinkedApproach(unittest.TestCase):
+    """Check that both query paths agree on an approach without an NEO."""
+
+    @classmethod
+    def setUpClass(cls):
+        neos = load_neos(TEST_NEO_FILE, cache=False)
+        approaches = load_approaches(TEST_CAD_FILE, cache=False)
+        cls.unlinked = CloseApproach('not an NEO', '2020-Jan-01 00:00', 0.01, 5.0)
+        cls.db = NEODatabase(neos, approaches + [cls.unlinked])
+        assert cls.unlinked.neo is None
+
+    def query_both_ways(self, **criteria):
+        filters = create_filters(**criteria)
+        received = set(self.db.query(filters))
+        plain = set(self.db.query(list(filters)))
+        self.assertEqual(received, plain, msg="Query paths disagree.")
+        return received
+
+    def test_unlinked_approach_matches_approach_criteria(self):
+        self.assertIn(self.unlinked, self.query_both_ways())
+        self.assertIn(self.unlinked, self.query_both_ways(
+            date=datetime.date(2020, 1, 1), distance_max=0.02))
+
+    def test_unlinked_approach_fails_neo_criteria(self):
+        for criteria in ({'hazardous': False}, {'hazardous': True},
+                         {'diameter_max': 100}, {'distance_max': 0.02, 'diameter_min': 0}):
+            with self.subTest(**criteria):
+                self.assertNotIn(self.unlinked, self.query_both_ways(**criteria))
+
+
+class TestFilters(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        neos = load_neos(TEST_NEO_FILE, cache=False)
+        cls.approaches = load_approaches(TEST_CAD_FILE, cache=False)
+        cls.db = NEODatabase(neos, cls.approaches)
+
+    def test_filters_are_immutable(self):
+        filters = create_filters(distance_max=0.1)
+        with self.assertRaises(AttributeError):
+            filters.append(lambda approach: False)
+        with self.assertRaises(TypeError):
+            filters.bounds['distance'] = (0, 1)
+        with self.assertRaises(AttributeError):
+            filters.bounds = {'velocity': (0, 1)}
+        with self.assertRaises(AttributeError):
+            del filters.bounds
+        self.assertEqual(dict(filters.bounds), {'distance': (float('-inf'), 0.1)})
+
+    def test_filters_can_be_copied_and_pickled(self):
+        filters = create_filters(distance_max=0.1, hazardous=True)
+        expected = set(self.db.query(filters))
+        for other in (copy.copy(filters), copy.deepcopy(filters),
+                      pickle.loads(pickle.dumps(filters))):
+            self.assertIsInstance(other, Filters)
+            self.assertEqual(dict(other.bounds), dict(filters.bounds))
+            self.assertEqual(set(self.db.query(other)), expected)
+            self.assertEqual(set(self.db.query(list(other))), expected)
+
+    def test_invalid_attribute_names_are_rejected(self):
+        for name in ('neo.if', 'class', 'distance + 1', 'neo.', '__import__("os")'):
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    compile_predicate({name: (1, 2)})
+
+    def test_combined_filters_are_applied_as_predicates(self):
+        filters = create_filters(distance_max=0.1) + (lambda approach: False,)
+        self.assertEqual(list(self.db.query(filters)), [])
+
+    def test_filters_on_attributes_without_column_are_applied_as_predicates(self):
+        expected = set(
+            approach for approach in self.approaches
+            if 0 <= approach.time.hour <= 5
+        )
+        self.assertGreater(len(expected), 0)
+
+        received = set(self.db.query(Filters({'time.hour': (0, 5)})))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -34,8 +34,8 @@ TEST_CAD_FILE = TESTS_ROOT / 'test-cad-2020.json'
 
 
 def build_results(n):
-    neos = tuple(load_neos(TEST_NEO_FILE))
-    approaches = tuple(load_approaches(TEST_CAD_FILE))
+    neos = tuple(load_neos(TEST_NEO_FILE, cache=False))
+    approaches = tuple(load_approaches(TEST_CAD_FILE, cache=False))
 
     # Only needed to link together these objects.
     NEODatabase(neos, approaches)